@@ -1,84 +1,408 @@
+import atexit
+import bisect
+import functools
 import json
+import logging
+import mmap
 import os
+import queue
 import re
-from typing import Dict, Any, Tuple
+import string
+import sys
+import threading
+from typing import Dict, Any, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+_EMAIL_TLD_CHARS = frozenset(string.ascii_letters)
+# Deletion table that strips every ASCII character except 0-9
+_KEEP_DIGITS = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+
+logger = logging.getLogger(__name__)
+
+
+def _format_domestic(digits: str) -> str:
+    """Format exactly 10 digits as (XXX) XXX-XXXX."""
+    return f"({digits[0:3]}) {digits[3:6]}-{digits[6:10]}"
+
+
+def _format_international(digits: str) -> str:
+    """Format exactly 12 digits as +XX (XXX) XXX-XXXX."""
+    return f"+{digits[0:2]} ({digits[2:5]}) {digits[5:8]}-{digits[8:12]}"
+
+
+# Formatters specialised by digit count, the only two lengths validation accepts
+_PHONE_FORMATTERS = {10: _format_domestic, 12: _format_international}
+
+
+class Contact(NamedTuple):
+    """A single contact's details, as handed out by ContactManager."""
+    phone: str
+    email: str
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass  # orjson rejects lone surrogates; the stdlib escapes them
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def _loads(data: Union[bytes, mmap.mmap]) -> Any:
+    """Parse JSON from bytes or a memory map, using orjson when it is installed."""
+    if orjson is not None:
+        # orjson reads the buffer in place, so a memory map is parsed without a copy
+        with memoryview(data) as view:
+            try:
+                return orjson.loads(view)
+            except orjson.JSONDecodeError:
+                pass  # Could be an escaped lone surrogate, which only the stdlib accepts
+    return json.loads(bytes(data))
 
 
 class ContactManager:
+    # Journal entries are buffered and written out every this many mutations
+    _FLUSH_EVERY = 10
+    # 10 digits (domestic) optionally followed by 2 more (country code), any separators around them
+    _PHONE_RE = re.compile(r'\D*(?:\d\D*){10}(?:(?:\d\D*){2})?')
+
     def __init__(self):
         self.filename = "contactbook.json"
-        self.contactbook = self._load_contacts()
+        self.journal_filename = "contactbook.jsonl"
+        contactbook = self._load_contacts()
+        journal_size = self._replay_journal(contactbook)
+
+        # Contacts are stored column-wise; _index maps a name to its row
+        self._names = list(contactbook)
+        self._phones = [details["phone"] for details in contactbook.values()]
+        self._emails = [details["email"] for details in contactbook.values()]
+        self._search_keys = [name.casefold() for name in self._names]
+        self._index = {name: row for row, name in enumerate(self._names)}
+        self._search_blob = None
+        self._search_offsets = []
+        self.journal = open(self.journal_filename, 'ab', buffering=0)
+        # Drop any torn tail so new entries don't get glued onto a partial line
+        self.journal.truncate(journal_size)
+        self._pending = []
+
+        # Compaction runs on a saver thread; _lock guards the journal handle it swaps out.
+        # _journal_base is the logical journal offset at which the current file starts.
+        self._lock = threading.Lock()
+        self._journal_base = 0
+        self._compact()
+        self._save_queue = queue.Queue(maxsize=1)
+        self._saver_thread = threading.Thread(target=self._saver, daemon=True)
+        self._saver_thread.start()
+        atexit.register(self.close)
 
     def _load_contacts(self) -> Dict[str, Dict[str, str]]:
         """Load contacts from JSON file or return empty dict if file doesn't exist."""
-        if os.path.exists(self.filename):
+        try:
+            with open(self.filename, 'rb') as contacts:
+                if os.fstat(contacts.fileno()).st_size == 0:
+                    return {}
+                with mmap.mmap(contacts.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return _loads(mapped)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _replay_journal(self, contactbook: Dict[str, Dict[str, str]]) -> int:
+        """Apply mutations journaled since the last snapshot on top of the loaded contacts.
+
+        Returns the byte length of the intact prefix of the journal.
+        """
+        valid_size = 0
+        try:
+            with open(self.journal_filename, 'rb') as journal:
+                for line in journal:
+                    if not line.endswith(b"\n"):
+                        break  # Torn final write from an interrupted session
+                    try:
+                        entry = _loads(line)
+                    except ValueError:  # Bad JSON or bad UTF-8
+                        break
+                    if not self._is_valid_entry(entry):
+                        break
+
+                    if entry["op"] == "delete":
+                        contactbook.pop(entry["name"], None)
+                    else:
+                        contactbook[entry["name"]] = entry["data"]
+                    valid_size += len(line)
+        except FileNotFoundError:
+            pass
+        return valid_size
+
+    @staticmethod
+    def _is_valid_entry(entry: Any) -> bool:
+        """Whether a decoded journal line has the shape _encode_entry writes."""
+        if not isinstance(entry, dict) or not isinstance(entry.get("name"), str):
+            return False
+        if entry.get("op") == "delete":
+            return True
+        data = entry.get("data")
+        return (entry.get("op") in ("add", "update")
+                and isinstance(data, dict)
+                and isinstance(data.get("phone"), str)
+                and isinstance(data.get("email"), str))
+
+    def _snapshot(self) -> Dict[str, Dict[str, str]]:
+        """Build the snapshot file's {name: {"phone": ..., "email": ...}} layout from the columns."""
+        return {
+            name: {"phone": phone, "email": email}
+            for name, phone, email in zip(self._names, self._phones, self._emails)
+        }
+
+    def _save_contacts(self, contactbook: Dict[str, Dict[str, str]]) -> None:
+        """Save contacts to JSON file, atomically replacing the previous snapshot."""
+        data = _dumps(contactbook, indent=True)
+        temp_filename = self.filename + ".tmp"
+        with open(temp_filename, 'wb') as contacts:
+            contacts.write(data)
+            # Make the new contents durable before the rename can expose them
+            contacts.flush()
+            os.fsync(contacts.fileno())
+        os.replace(temp_filename, self.filename)
+
+    def _encode_entry(self, op: str, name: str) -> bytes:
+        """Encode one journal line carrying the contact's current state (None once deleted)."""
+        contact = self.get_contact(name)
+        entry = {"op": op, "name": name, "data": contact._asdict() if contact else None}
+        return _dumps(entry) + b"\n"
+
+    def _record(self, op: str, name: str) -> None:
+        """Queue a single mutation for the journal instead of rewriting the snapshot."""
+        self._pending.append(self._encode_entry(op, name))
+        if len(self._pending) >= self._FLUSH_EVERY:
+            self.flush()
+            self._schedule_compaction()
+
+    def flush(self) -> None:
+        """Write all pending mutations to the journal in one call."""
+        if self._pending:
+            with self._lock:
+                self.journal.write(b"".join(self._pending))
+            self._pending.clear()
+
+    def _journal_outgrew_snapshot(self) -> bool:
+        """Whether the journal on disk is larger than the snapshot it extends."""
+        journal_size = os.fstat(self.journal.fileno()).st_size
+        snapshot_size = os.path.getsize(self.filename) if os.path.exists(self.filename) else 0
+        return journal_size > snapshot_size
+
+    def _schedule_compaction(self) -> None:
+        """Hand the saver thread a snapshot once the journal outgrows the snapshot file."""
+        with self._lock:
+            if not self._journal_outgrew_snapshot():
+                return
+            offset = self._journal_base + os.fstat(self.journal.fileno()).st_size
+
+        # One-slot queue: a newer snapshot replaces one the saver hasn't picked up yet
+        try:
+            self._save_queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._save_queue.put_nowait((self._snapshot(), offset))
+
+    def _saver(self) -> None:
+        """Write queued snapshots, then drop the journal entries each one covers."""
+        while True:
+            job = self._save_queue.get()
+            if job is None:
+                return
+
+            contactbook, offset = job
             try:
-                with open(self.filename, 'r') as contacts:
-                    return json.load(contacts)
-            except (json.JSONDecodeError, FileNotFoundError):
-                return {}
-        return {}
-
-    def _save_contacts(self) -> None:
-        """Save contacts to JSON file."""
-        with open(self.filename, 'w') as contacts:
-            json.dump(self.contactbook, contacts, indent=4)
-
-    def _validate_email(self, email: str) -> bool:
-        """Validate email format using regex."""
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(email_pattern, email) is not None
-
-    def _validate_phone(self, phone: str) -> bool:
-        """Validate phone number - should be 10 digits or 12 digits with country code."""
-        # Remove all non-digit characters
-        digits_only = re.sub(r'\D', '', phone)
+                # Returns only once the snapshot is fsynced, so trimming below is safe
+                self._save_contacts(contactbook)
+                self._trim_journal(offset)
+            except OSError:
+                # Keep the thread alive; the journal still holds every change
+                logger.exception("Background compaction of %s failed", self.filename)
+
+    def _trim_journal(self, offset: int) -> None:
+        """Replace the journal with only the entries appended after the logical offset."""
+        with self._lock:
+            with open(self.journal_filename, 'rb') as journal:
+                journal.seek(offset - self._journal_base)
+                tail = journal.read()
+            temp_filename = self.journal_filename + ".tmp"
+            with open(temp_filename, 'wb') as journal:
+                journal.write(tail)
+                journal.flush()
+                os.fsync(journal.fileno())
+
+            self.journal.close()
+            try:
+                os.replace(temp_filename, self.journal_filename)
+                self._journal_base = offset
+            finally:
+                # Reopen whichever journal is now in place so main-thread writes keep working
+                self.journal = open(self.journal_filename, 'ab', buffering=0)
+
+    def _compact(self) -> bool:
+        """Fold the journal into the snapshot once it outgrows it, on the calling thread.
+
+        Only call this while the saver thread is not running (before it starts in __init__,
+        or after close() has joined it); it neither takes _lock nor updates _journal_base.
+        Returns whether a compaction happened.
+        """
+        self.flush()
+        if not self._journal_outgrew_snapshot():
+            return False
 
-        # Check if it's exactly 10 digits (domestic) or 12 digits (with country code)
-        if len(digits_only) == 10:
-            return True
-        elif len(digits_only) == 12:
-            return True
-        else:
+        # _save_contacts fsyncs the snapshot, so the journal is only dropped once it is redundant
+        self._save_contacts(self._snapshot())
+        self.journal.truncate(0)
+        return True
+
+    def close(self) -> None:
+        """Stop the saver thread, then compact and durably flush the journal before exiting."""
+        if self.journal.closed:
+            return
+
+        try:
+            self._save_queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._save_queue.put(None)
+        self._saver_thread.join()
+
+        if not self._compact():
+            os.fsync(self.journal.fileno())
+        self.journal.close()
+
+    @property
+    def contactbook(self) -> Dict[str, Contact]:
+        """All contacts as a {name: Contact} dict built from the columns."""
+        return {
+            name: Contact(phone, email)
+            for name, phone, email in zip(self._names, self._phones, self._emails)
+        }
+
+    def get_contact(self, name: str) -> Optional[Contact]:
+        """Return a single contact's details, or None if it doesn't exist."""
+        row = self._index.get(name)
+        if row is None:
+            return None
+        return Contact(self._phones[row], self._emails[row])
+
+    @staticmethod
+    def _validate_email(email: str) -> bool:
+        """Validate email format (local@domain.tld) with a single structural scan."""
+        at = email.find('@')
+        if at <= 0 or email.find('@', at + 1) != -1:
+            return False
+
+        local, domain = email[:at], email[at + 1:]
+        dot = domain.rfind('.')
+        if dot < 1 or len(domain) - dot - 1 < 2:
             return False
 
-    def _format_phone(self, phone: str) -> str:
-        """Format phone number for consistent storage."""
-        digits_only = re.sub(r'\D', '', phone)
-
-        if len(digits_only) == 10:
-            # Format as (XXX) XXX-XXXX
-            return f"({digits_only[:3]}) {digits_only[3:6]}-{digits_only[6:]}"
-        elif len(digits_only) == 12:
-            # Format as +XX (XXX) XXX-XXXX
-            return f"+{digits_only[:2]} ({digits_only[2:5]}) {digits_only[5:8]}-{digits_only[8:]}"
-        return phone
-
-    def add_contact(self, name: str, phone: str, email: str) -> str:
-        """Add a new contact if it doesn't exist."""
-        if name in self.contactbook:
+        return (_EMAIL_LOCAL_CHARS.issuperset(local)
+                and _EMAIL_DOMAIN_CHARS.issuperset(domain[:dot])
+                and _EMAIL_TLD_CHARS.issuperset(domain[dot + 1:]))
+
+    @classmethod
+    def _validate_phone(cls, phone: str) -> bool:
+        """Validate phone number - should be 10 digits or 12 digits with country code."""
+        # Count digits in the regex itself rather than building a stripped copy
+        return cls._PHONE_RE.fullmatch(phone) is not None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _format_phone(phone: str) -> str:
+        """Format phone number for consistent storage (memoized on the raw input)."""
+        if phone.isascii() and phone.isdigit():  # Already bare digits; nothing to strip
+            digits_only = phone
+        else:
+            digits_only = phone.translate(_KEEP_DIGITS)
+            if not digits_only.isascii():  # Non-ASCII input; fall back to a Unicode-aware strip
+                digits_only = ''.join(char for char in phone if char.isdecimal())
+
+        formatter = _PHONE_FORMATTERS.get(len(digits_only))
+        return formatter(digits_only) if formatter else phone
+
+    def _insert_row(self, name: str, formatted_phone: str, email: str) -> None:
+        """Append a contact to every column; the caller has already reserved its _index row."""
+        self._names.append(name)
+        self._phones.append(formatted_phone)
+        self._emails.append(email)
+        self._search_keys.append(name.casefold())
+        self._search_blob = None
+
+    def add_contact(self, name: str, phone: str, email: str, _validated: bool = False) -> str:
+        """Add a new contact if it doesn't exist.
+
+        Pass _validated=True only when the caller has already checked phone and email.
+        """
+        # Reserve the next row and check for an existing contact in one probe
+        row = len(self._names)
+        if self._index.setdefault(name, row) != row:
             return f"⚠️ Contact '{name}' already exists!"
 
-        # Validate email
-        if not self._validate_email(email):
-            return f"❌ Invalid email format! Please enter a valid email address."
+        if not _validated:
+            # Validate email
+            if not self._validate_email(email):
+                del self._index[name]
+                return f"❌ Invalid email format! Please enter a valid email address."
 
-        # Validate phone
-        if not self._validate_phone(phone):
-            return f"❌ Invalid phone number! Please enter 10 digits (domestic) or 12 digits (with country code)."
+            # Validate phone
+            if not self._validate_phone(phone):
+                del self._index[name]
+                return f"❌ Invalid phone number! Please enter 10 digits (domestic) or 12 digits (with country code)."
 
         # Format phone number
         formatted_phone = self._format_phone(phone)
 
-        self.contactbook[name] = {"phone": formatted_phone, "email": email}
-        self._save_contacts()
+        self._insert_row(name, formatted_phone, email)
+        self._record("add", name)
         return f"✅ {name} saved successfully!"
 
+    def add_batch(self, rows: Iterable[Tuple[str, str, str]]) -> str:
+        """Add many (name, phone, email) rows in one pass, skipping duplicates and invalid rows."""
+        # Bind everything the loop touches to locals to keep per-row overhead down
+        index, names, pending = self._index, self._names, self._pending
+        validate_email, validate_phone = self._validate_email, self._validate_phone
+        format_phone, insert_row, encode_entry = self._format_phone, self._insert_row, self._encode_entry
+
+        added = skipped = 0
+        for name, phone, email in rows:
+            row = len(names)
+            if index.setdefault(name, row) != row:
+                skipped += 1
+                continue
+            if not (validate_email(email) and validate_phone(phone)):
+                del index[name]
+                skipped += 1
+                continue
+
+            insert_row(name, format_phone(phone), email)
+            pending.append(encode_entry("add", name))
+            added += 1
+
+        self.flush()
+        self._schedule_compaction()
+        return f"✅ {added} contacts imported, {skipped} skipped."
+
     def update_contact(self, name: str, phone: str = None, email: str = None) -> str:
         """Update an existing contact's details."""
-        if name not in self.contactbook:
+        row = self._index.get(name)
+        if row is None:
             return f"⚠️ Contact '{name}' not found!"
 
+        # Re-entering the stored phone number is a no-op
+        if phone and phone == self._phones[row]:
+            phone = None
+
         # Validate phone if provided
         if phone and not self._validate_phone(phone):
             return f"❌ Invalid phone number! Please enter 10 digits (domestic) or 12 digits (with country code)."
@@ -87,42 +411,105 @@ class ContactManager:
         if email and not self._validate_email(email):
             return f"❌ Invalid email format! Please enter a valid email address."
 
+        changed = False
         if phone:
-            self.contactbook[name]["phone"] = self._format_phone(phone)
-        if email:
-            self.contactbook[name]["email"] = email
-
-        self._save_contacts()
+            formatted_phone = self._format_phone(phone)
+            if formatted_phone != self._phones[row]:
+                self._phones[row] = formatted_phone
+                changed = True
+        if email and email != self._emails[row]:
+            self._emails[row] = email
+            changed = True
+
+        if not changed:
+            return f"ℹ️ No changes made to {name}."
+
+        self._record("update", name)
         return f"✅ {name} updated successfully!"
 
-    def search_contact(self, search_term: str) -> Dict[str, Dict[str, str]]:
+    def _build_search_blob(self) -> None:
+        """Pack the search keys into one NUL-separated bytes blob with row start offsets."""
+        encoded = [key.encode(errors="surrogatepass") for key in self._search_keys]
+        offsets = []
+        position = 0
+        for key in encoded:
+            offsets.append(position)
+            position += len(key) + 1
+        offsets.append(position)  # Sentinel so offsets[row + 1] always exists
+
+        self._search_blob = b"\0".join(encoded) + b"\0"
+        self._search_offsets = offsets
+
+    def _matching_rows(self, term: str) -> List[int]:
+        """Return the rows whose search key contains term, scanning the blob with bytes.find."""
+        if not term:
+            return list(range(len(self._names)))
+
+        needle = term.encode(errors="surrogatepass")
+        if b"\0" in needle:  # Could straddle two names in the blob
+            return []
+
+        if self._search_blob is None:
+            self._build_search_blob()
+
+        blob, offsets = self._search_blob, self._search_offsets
+        rows = []
+        position = blob.find(needle)
+        while position != -1:
+            row = bisect.bisect_right(offsets, position) - 1
+            rows.append(row)
+            # Resume at the next name; one hit per contact is enough
+            position = blob.find(needle, offsets[row + 1])
+        return rows
+
+    def search_contact(self, search_term: str) -> Dict[str, Contact]:
         """Search for contacts by partial name match (case-insensitive)."""
         results = {
-            name: details
-            for name, details in self.contactbook.items()
-            if search_term.lower() in name.lower()
+            self._names[row]: Contact(self._phones[row], self._emails[row])
+            for row in self._matching_rows(search_term.casefold())
         }
         return results if results else "No matching contacts found."
 
     def delete_contact(self, name: str) -> str:
         """Delete a contact by name."""
-        if name not in self.contactbook:
+        row = self._index.pop(name, None)
+        if row is None:
             return f"⚠️ Contact '{name}' does not exist!"
 
-        del self.contactbook[name]
-        self._save_contacts()
+        # Swap the last row into the deleted slot so removal stays O(1)
+        last = len(self._names) - 1
+        columns = (self._names, self._phones, self._emails, self._search_keys)
+        if row != last:
+            for column in columns:
+                column[row] = column[last]
+            self._index[self._names[row]] = row
+        for column in columns:
+            column.pop()
+        self._search_blob = None
+
+        self._record("delete", name)
         return f"✅ {name} deleted successfully!"
 
-    def view_contacts(self) -> Dict[str, Dict[str, str]]:
+    def view_contacts(self) -> Dict[str, Contact]:
         """Return all contacts."""
-        return self.contactbook if self.contactbook else "No contacts found."
+        return self.contactbook if self._names else "No contacts found."
+
+
+MENU_STR = ("\n📞 Contact Manager Menu:\n"
+            "1. Add New Contact\t2. Update Contact\t"
+            "3. Delete Contact\t4. Search Contact\t"
+            "5. View All Contacts\t6. Exit\n")
 
 
 def display_menu():
-    print("\n📞 Contact Manager Menu:")
-    print("1. Add New Contact\t2. Update Contact\t"
-          "3. Delete Contact\t4. Search Contact\t"
-          "5. View All Contacts\t6. Exit")
+    sys.stdout.write(MENU_STR)
+
+
+def display_contacts(header: str, contacts: Dict[str, Contact]) -> None:
+    """Print a header and one line per contact with a single write."""
+    lines = [f"{name}: Phone: {contact.phone}, Email: {contact.email}"
+             for name, contact in contacts.items()]
+    sys.stdout.write(f"\n{header}\n" + "\n".join(lines) + "\n")
 
 
 def get_contact_details() -> Tuple[str, str, str]:
@@ -132,8 +519,7 @@ def get_contact_details() -> Tuple[str, str, str]:
     # Phone input with validation
     while True:
         phone = input("Enter phone number (10 digits domestic or 12 digits with country code): ").strip()
-        digits_only = re.sub(r'\D', '', phone)
-        if len(digits_only) in [10, 12]:
+        if ContactManager._validate_phone(phone):
             break
         print(
             "❌ Invalid phone format! Use 10 digits (e.g., 1234567890) or 12 digits with country code (e.g., 911234567890)")
@@ -141,8 +527,7 @@ def get_contact_details() -> Tuple[str, str, str]:
     # Email input with validation
     while True:
         email = input("Enter email: ").strip()
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if re.match(email_pattern, email):
+        if ContactManager._validate_email(email):
             break
         print("❌ Invalid email format! Please enter a valid email address (e.g., user@example.com)")
 
@@ -159,8 +544,7 @@ def get_updated_contact_details(current_phone: str, current_email: str) -> Tuple
         if not phone:  # Keep current value
             phone = None
             break
-        digits_only = re.sub(r'\D', '', phone)
-        if len(digits_only) in [10, 12]:
+        if ContactManager._validate_phone(phone):
             break
         print("❌ Invalid phone format! Use 10 digits or 12 digits with country code")
 
@@ -170,8 +554,7 @@ def get_updated_contact_details(current_phone: str, current_email: str) -> Tuple
         if not email:  # Keep current value
             email = None
             break
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if re.match(email_pattern, email):
+        if ContactManager._validate_email(email):
             break
         print("❌ Invalid email format! Please enter a valid email address")
 
@@ -187,16 +570,18 @@ def start():
 
         if choice == "1":  # Add Contact
             name, phone, email = get_contact_details()
-            print(manager.add_contact(name, phone, email))
+            # get_contact_details only returns once phone and email pass validation
+            print(manager.add_contact(name, phone, email, _validated=True))
 
         elif choice == "2":  # Update Contact
             name = input("Enter name of contact to update: ").strip()
-            if name not in manager.contactbook:
+            current = manager.get_contact(name)
+            if current is None:
                 print(f"⚠️ Contact '{name}' not found!")
                 continue
 
-            current_phone = manager.contactbook[name]['phone']
-            current_email = manager.contactbook[name]['email']
+            current_phone = current.phone
+            current_email = current.email
             phone, email = get_updated_contact_details(current_phone, current_email)
             print(manager.update_contact(name, phone, email))
 
@@ -210,20 +595,17 @@ def start():
             if isinstance(results, str):
                 print(results)
             else:
-                print("\n🔍 Search Results:")
-                for name, details in results.items():
-                    print(f"{name}: Phone: {details['phone']}, Email: {details['email']}")
+                display_contacts("🔍 Search Results:", results)
 
         elif choice == "5":  # View All Contacts
             contacts = manager.view_contacts()
             if isinstance(contacts, str):
                 print(contacts)
             else:
-                print("\n📒 All Contacts:")
-                for name, details in contacts.items():
-                    print(f"{name}: Phone: {details['phone']}, Email: {details['email']}")
+                display_contacts("📒 All Contacts:", contacts)
 
         elif choice == "6":  # Exit
+            manager.close()
             print("👋 Goodbye!")
             break
 